@@ -106,6 +106,9 @@ class StingrayObject(object):
         Array attributes (e.g. ``time``, ``pi``, ``energy``, etc. for
         ``EventList``) are converted into columns, while meta attributes
         (``mjdref``, ``gti``, etc.) are saved into the ``meta`` dictionary.
+
+        The array attributes are not copied: the columns of the table share
+        memory with them, wherever possible.
         """
         data = {}
         array_attrs = self.array_attrs()
@@ -113,7 +116,7 @@ class StingrayObject(object):
         for attr in array_attrs:
             data[attr] = np.asarray(getattr(self, attr))
 
-        ts = Table(data)
+        ts = Table(data, copy=False)
 
         ts.meta.update(self.get_meta_dict())
 
@@ -219,6 +222,8 @@ class StingrayObject(object):
         Array attributes (e.g. ``time``, ``pi``, ``energy``, etc. for
         ``EventList``) are converted into columns, while meta attributes
         (``mjdref``, ``gti``, etc.) are saved into the ``ds.attrs`` dictionary.
+
+        The array attributes are not copied, wherever ``pandas`` allows it.
         """
         from pandas import DataFrame
 
@@ -228,7 +233,7 @@ class StingrayObject(object):
         for attr in array_attrs:
             data[attr] = np.asarray(getattr(self, attr))
 
-        ts = DataFrame(data)
+        ts = DataFrame(data, copy=False)
 
         ts.attrs.update(self.get_meta_dict())
 
@@ -397,7 +402,9 @@ class StingrayObject(object):
             pass
         elif fmt.lower() == "pickle":
             with open(filename, "wb") as fobj:
-                pickle.dump(self, fobj)
+                # Protocol 5 (PEP 574) lets numpy write array buffers directly
+                # to the file, without an intermediate copy in memory
+                pickle.dump(self, fobj, protocol=pickle.HIGHEST_PROTOCOL)
             return
         elif fmt.lower() == "ascii":
             fmt = "ascii.ecsv"
@@ -447,7 +454,7 @@ class StingrayTimeseries(StingrayObject):
 
         if self.time is not None and np.size(self.time) > 0:  # type: ignore
             times = TimeDelta(self.time * u.s)  # type: ignore
-            ts = TimeSeries(data=data, time=times)
+            ts = TimeSeries(data=data, time=times, copy=False)
         else:
             ts = TimeSeries()
 
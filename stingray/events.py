@@ -23,6 +23,51 @@ from .utils import assign_value_if_none, simon, interpret_times
 __all__ = ['EventList']
 
 
+def _is_sorted(array):
+    """Check if an array is sorted in non-decreasing order."""
+    array = np.asarray(array)
+    return bool(np.all(array[1:] >= array[:-1]))
+
+
+def _shift_array(array, time_shift):
+    """Add a time shift to an array, allocating the output only once."""
+    array = np.asarray(array)
+    out = np.empty(array.shape, dtype=np.result_type(array, time_shift))
+    return np.add(array, time_shift, out=out)
+
+
+def _bounds_in_dtype(value_range, dtype):
+    """Convert the bounds of a ``[min, max)`` interval to ``dtype``, if possible.
+
+    Comparing an array with bounds of its own type avoids upcasting the whole
+    array (e.g. integer PI channels compared to float bounds). For integer
+    types, the bounds are rounded up, which selects exactly the same values.
+    If the bounds cannot be represented in ``dtype``, they are returned
+    unchanged.
+
+    Examples
+    --------
+    >>> lo, hi = _bounds_in_dtype([0.5, 10], np.int16)
+    >>> lo.dtype == hi.dtype == np.int16
+    True
+    >>> int(lo), int(hi)
+    (1, 10)
+    >>> lo, hi = _bounds_in_dtype([-1e6, 10], np.int16)
+    >>> lo, hi
+    (-1000000.0, 10)
+    """
+    dtype = np.dtype(dtype)
+    value_min, value_max = value_range[0], value_range[1]
+    if dtype.kind in 'iu':
+        info = np.iinfo(dtype)
+        int_min, int_max = np.ceil(value_min), np.ceil(value_max)
+        if info.min <= int_min <= info.max and info.min <= int_max <= info.max:
+            return dtype.type(int_min), dtype.type(int_max)
+    elif dtype.kind == 'f':
+        return dtype.type(value_min), dtype.type(value_max)
+    return value_min, value_max
+
+
 class EventList(StingrayTimeseries):
     """
     Basic class for event list data. Event lists generally correspond to individual events (e.g. photons)
@@ -62,6 +107,14 @@ class EventList(StingrayTimeseries):
     high_precision : bool
         Change the precision of self.time to float128. Useful while dealing with fast pulsars.
 
+    time_dtype : numpy dtype, default None
+        Store ``self.time`` as a contiguous array of this type (e.g.
+        ``np.float32``, to halve memory use and memory traffic when times are
+        small, e.g. referred to the start of the observation). Note that
+        ``float32`` values only have about 7 significant digits, so they are
+        not adequate for times of order 10^8 s, common with mission MJDREFs.
+        Ignored if ``high_precision`` is True.
+
     mission : str
         Mission that recorded the data (e.g. NICER)
 
@@ -132,7 +185,7 @@ class EventList(StingrayTimeseries):
     def __init__(self, time=None, energy=None, ncounts=None, mjdref=0, dt=0,
                  notes="", gti=None, pi=None, high_precision=False,
                  mission=None, instr=None, header=None, detector_id=None,
-                 ephem=None, timeref=None, timesys=None,
+                 ephem=None, timeref=None, timesys=None, time_dtype=None,
                  **other_kw):
         StingrayObject.__init__(self)
 
@@ -155,11 +208,15 @@ class EventList(StingrayTimeseries):
             warnings.warn(f"Unrecognized keywords: {list(other_kw.keys())}")
 
         if time is not None:
-            time, mjdref = interpret_times(time, mjdref)
-            if not high_precision:
-                self.time = np.asarray(time)
-            else:
+            # Plain arrays of numbers are already in seconds from MJDREF
+            if type(time) is not np.ndarray or time.dtype.kind not in 'fiu':
+                time, mjdref = interpret_times(time, mjdref)
+            if high_precision:
                 self.time = np.asarray(time, dtype=np.longdouble)
+            elif time_dtype is not None:
+                self.time = np.ascontiguousarray(time, dtype=time_dtype)
+            else:
+                self.time = np.asarray(time)
             self.ncounts = self.time.size
         else:
             self.time = None
@@ -168,6 +225,59 @@ class EventList(StingrayTimeseries):
             if self.time.size != self.energy.size:
                 raise ValueError('Lengths of time and energy must be equal.')
 
+    def _instance_attrs(self):
+        """List the names of the public attributes set on this instance.
+
+        All attributes of :class:`EventList`, standard or user-defined, are
+        plain instance attributes, so there is no need to scan ``dir(self)``
+        (methods, class attributes, etc.) as the generic implementation does.
+        """
+        return sorted(attr for attr in vars(self) if not attr.startswith("_"))
+
+    def array_attrs(self):
+        """List the names of the array attributes of the event list.
+
+        By array attributes, we mean the ones with the same size and shape as
+        ``time`` (e.g. ``energy``, ``pi``, etc.)
+
+        Examples
+        --------
+        >>> evt = EventList(time=[0, 1, 2], pi=[3, 4, 5], gti=[[0, 3]])
+        >>> evt.bubuattr = [222, 111, 333]
+        >>> evt.array_attrs()
+        ['bubuattr', 'pi', 'time']
+        """
+        if self.time is None:
+            return []
+
+        shape = np.shape(self.time)
+        return [
+            attr
+            for attr in self._instance_attrs()
+            if (
+                isinstance(value := getattr(self, attr), Iterable)
+                and np.shape(value) == shape
+            )
+        ]
+
+    def meta_attrs(self):
+        """List the names of the meta attributes of the event list.
+
+        By meta attributes, we mean the ones with a different size and shape
+        than ``time`` (e.g. ``mjdref``, ``gti``, etc.)
+        """
+        array_attrs = self.array_attrs()
+        return [
+            attr
+            for attr in self._instance_attrs()
+            if (
+                attr not in array_attrs
+                and not callable(value := getattr(self, attr))
+                # a way to avoid EventLists, Lightcurves, etc.
+                and not hasattr(value, "meta_attrs")
+            )
+        ]
+
     def to_lc(self, dt, tstart=None, tseg=None):
         """
         Convert event list to a :class:`stingray.Lightcurve` object.
@@ -266,10 +376,11 @@ class EventList(StingrayTimeseries):
             The resulting list of photon arrival times generated from the light curve.
         """
 
-        # Multiply times by number of counts
-        times = [[i] * int(j) for i, j in zip(lc.time, lc.counts)]
-        # Concatenate all lists
-        times = [i for j in times for i in j]
+        # Repeat each time stamp by the number of counts in its bin
+        # Bins with negative counts (e.g. after background subtraction)
+        # contribute no events
+        counts = np.clip(np.asarray(lc.counts).astype(np.int64), 0, None)
+        times = np.repeat(np.asarray(lc.time), counts)
 
         return EventList(time=times, gti=lc.gti)
 
@@ -310,7 +421,7 @@ class EventList(StingrayTimeseries):
         self.gti = lc.gti
         self.ncounts = len(self.time)
 
-    def simulate_energies(self, spectrum, use_spline=False):
+    def simulate_energies(self, spectrum, use_spline=False, rng=None):
         """
         Assign (simulate) energies to event list from a spectrum.
 
@@ -325,6 +436,13 @@ class EventList(StingrayTimeseries):
             (similarly to the bins of `np.histogram`).
             Note that for non-uniformly binned spectra, it is advisable to pass
             the exact edges.
+
+        Other Parameters
+        ----------------
+        rng : `np.random.Generator` or `np.random.RandomState`, default None
+            The random number generator to use. By default, the global
+            `np.random` state is used. A generator created with
+            `np.random.default_rng` is usually faster.
         """
         from .simulator.base import simulate_with_inverse_cdf
 
@@ -348,7 +466,8 @@ class EventList(StingrayTimeseries):
             energy = np.concatenate([energy - de / 2, [energy[-1] + de / 2]])
 
         self.energy = simulate_with_inverse_cdf(
-            fluxes, self.ncounts, edges=energy, sorted=False, interp_kind="linear")
+            fluxes, self.ncounts, edges=energy, sorted=False, interp_kind="linear",
+            rng=rng)
 
     def sort(self, inplace=False):
         """Sort the event list in time.
@@ -393,6 +512,160 @@ class EventList(StingrayTimeseries):
         order = np.argsort(self.time)
         return self.apply_mask(order, inplace=inplace)
 
+    def _detector_ids_and_number(self, n_det=None):
+        """Return ``detector_id`` as an integer array and the number of detectors."""
+        if self.detector_id is None:
+            raise ValueError("This event list has no detector_id information")
+        detector_id = np.asarray(self.detector_id).astype(np.intp)
+        if n_det is None:
+            n_det = int(detector_id.max()) + 1 if detector_id.size > 0 else 0
+        return detector_id, n_det
+
+    def counts_per_detector(self, n_det=None):
+        """Count the events recorded by each detector.
+
+        Other Parameters
+        ----------------
+        n_det : int, default None
+            Minimum number of detectors in the output. By default, the maximum
+            value of ``detector_id`` plus one.
+
+        Returns
+        -------
+        counts : array of ``int``
+            The number of events for each ``detector_id`` value (the index
+            of the array)
+
+        Examples
+        --------
+        >>> events = EventList(time=[0, 1, 2, 3], detector_id=[0, 2, 2, 0])
+        >>> np.allclose(events.counts_per_detector(), [2, 0, 2])
+        True
+        >>> np.allclose(events.counts_per_detector(n_det=4), [2, 0, 2, 0])
+        True
+        """
+        detector_id, n_det = self._detector_ids_and_number(n_det)
+        return np.bincount(detector_id, minlength=n_det)
+
+    def mean_time_per_detector(self, n_det=None):
+        """Calculate the mean arrival time of the events of each detector.
+
+        Other Parameters
+        ----------------
+        n_det : int, default None
+            Minimum number of detectors in the output. By default, the maximum
+            value of ``detector_id`` plus one.
+
+        Returns
+        -------
+        mean_time : array of ``float``
+            The mean event time for each ``detector_id`` value (the index
+            of the array), with the same precision as ``time``. NaN for
+            detectors with no events.
+
+        Examples
+        --------
+        >>> events = EventList(time=[0, 1, 2, 3], detector_id=[0, 2, 2, 0])
+        >>> mean_time = events.mean_time_per_detector()
+        >>> np.allclose(mean_time[[0, 2]], [1.5, 1.5])
+        True
+        >>> np.isnan(mean_time[1])
+        True
+        """
+        detector_id, n_det = self._detector_ids_and_number(n_det)
+        counts = np.bincount(detector_id, minlength=n_det)
+        time = np.asarray(self.time)
+        if np.issubdtype(time.dtype, np.floating) and time.dtype != np.float64:
+            # bincount casts the weights to float64. Keep the precision of
+            # e.g. longdouble times
+            time_sum = np.zeros(counts.size, dtype=time.dtype)
+            np.add.at(time_sum, detector_id, time)
+        else:
+            time_sum = np.bincount(detector_id, weights=time, minlength=n_det)
+        return np.divide(time_sum, counts, out=np.full_like(time_sum, np.nan),
+                         where=counts != 0)
+
+    def shift(self, time_shift):
+        """Shift the events and the GTIs by the same amount.
+
+        Only ``time`` and ``gti`` are recalculated. All other attributes
+        (``energy``, ``pi``, ``header``, etc.) are not affected by the shift,
+        and the new event list shares them with the original one instead of
+        copying them.
+
+        Parameters
+        ----------
+        time_shift: float
+            The time interval by which the event list will be shifted (in
+            the same units as the time array)
+
+        Returns
+        -------
+        ev : :class:`EventList` object
+            The new event list shifted by ``time_shift``
+
+        Examples
+        --------
+        >>> events = EventList(time=[0, 1, 2], energy=[3, 4, 5], gti=[[0, 3]])
+        >>> new_ev = events.shift(10)
+        >>> np.allclose(new_ev.time, [10, 11, 12])
+        True
+        >>> np.allclose(new_ev.gti, [[10, 13]])
+        True
+        >>> np.allclose(events.time, [0, 1, 2])
+        True
+        >>> new_ev.energy is events.energy
+        True
+        """
+        new_ev = copy.copy(self)
+        new_ev.time = _shift_array(self.time, time_shift)
+        if self.gti is not None:
+            new_ev.gti = _shift_array(self.gti, time_shift)
+
+        return new_ev
+
+    def change_mjdref(self, new_mjdref):
+        """Change the MJD reference time (MJDREF) of the event list.
+
+        The times of the event list will be shifted in order to be referred to
+        this new MJDREF, using :meth:`shift`: only ``time`` and ``gti`` are
+        recalculated, and all other attributes are shared with the original
+        event list.
+
+        Parameters
+        ----------
+        new_mjdref : float
+            New MJDREF
+
+        Returns
+        -------
+        new_ev : :class:`EventList` object
+            The new event list, shifted by MJDREF
+
+        Examples
+        --------
+        >>> events = EventList(time=[0, 1, 2], gti=[[0, 3]], mjdref=57001)
+        >>> new_ev = events.change_mjdref(57000)
+        >>> new_ev.mjdref == 57000
+        True
+        >>> np.allclose(new_ev.time, [86400, 86401, 86402])
+        True
+        >>> np.allclose(new_ev.gti, [[86400, 86403]])
+        True
+        """
+        if np.asarray(self.time).dtype == np.longdouble:
+            # Keep the full precision of the MJDs in the shift, and avoid
+            # mixing float64 and longdouble values in the addition
+            time_shift = (np.longdouble(self.mjdref) - np.longdouble(new_mjdref)) \
+                * np.longdouble(86400)
+        else:
+            time_shift = (self.mjdref - new_mjdref) * 86400
+
+        new_ev = self.shift(time_shift)
+        new_ev.mjdref = new_mjdref
+
+        return new_ev
+
     def join(self, other):
         """
         Join two :class:`EventList` objects into one.
@@ -438,9 +711,42 @@ class EventList(StingrayTimeseries):
         if not np.isclose(self.mjdref, other.mjdref, atol=1e-6 / 86400):
             other = other.change_mjdref(self.mjdref)
 
-        ev_new.time = np.concatenate([self.time, other.time])
-        order = np.argsort(ev_new.time)
-        ev_new.time = ev_new.time[order]
+        n_self, n_other = self.time.size, other.time.size
+
+        # Find the position of each event of ``self`` and ``other`` in the
+        # joined event list. Events of ``self`` come first in case of equal
+        # times.
+        inputs_sorted = _is_sorted(self.time) and _is_sorted(other.time)
+        if inputs_sorted and (n_self == 0 or n_other == 0):
+            # One of the event lists is empty (e.g. when appending to an
+            # initially empty event list): just copy the other one.
+            pos_self, pos_other = slice(0, n_self), slice(n_self, None)
+        elif inputs_sorted:
+            # Both inputs are already sorted: merge them in linear time
+            # instead of sorting the concatenated array.
+            pos_other = np.searchsorted(self.time, other.time, side='right')
+            pos_other += np.arange(n_other)
+            from_self = np.ones(n_self + n_other, dtype=bool)
+            from_self[pos_other] = False
+            pos_self = np.flatnonzero(from_self)
+        else:
+            order = np.argsort(np.concatenate([self.time, other.time]),
+                               kind='stable')
+            positions = np.empty_like(order)
+            positions[order] = np.arange(n_self + n_other)
+            pos_self, pos_other = positions[:n_self], positions[n_self:]
+
+        def _merge(self_arr, other_arr):
+            # Write directly into a single preallocated output array, instead
+            # of concatenating and then reordering
+            self_arr, other_arr = np.asarray(self_arr), np.asarray(other_arr)
+            merged = np.empty(n_self + n_other,
+                              dtype=np.result_type(self_arr, other_arr))
+            merged[pos_self] = self_arr
+            merged[pos_other] = other_arr
+            return merged
+
+        ev_new.time = _merge(self.time, other.time)
 
         if (self.pi is None) and (other.pi is None):
             ev_new.pi = None
@@ -450,8 +756,7 @@ class EventList(StingrayTimeseries):
                                             np.zeros_like(other.time))
 
         if (self.pi is not None) and (other.pi is not None):
-            ev_new.pi = np.concatenate([self.pi, other.pi])
-            ev_new.pi = ev_new.pi[order]
+            ev_new.pi = _merge(self.pi, other.pi)
 
         if (self.energy is None) and (other.energy is None):
             ev_new.energy = None
@@ -462,8 +767,7 @@ class EventList(StingrayTimeseries):
                                                 np.zeros_like(other.time))
 
         if (self.energy is not None) and (other.energy is not None):
-            ev_new.energy = np.concatenate([self.energy, other.energy])
-            ev_new.energy = ev_new.energy[order]
+            ev_new.energy = _merge(self.energy, other.energy)
 
         if self.gti is None and other.gti is not None and len(self.time) > 0:
             self.gti = \
@@ -497,6 +801,37 @@ class EventList(StingrayTimeseries):
 
         return ev_new
 
+    @classmethod
+    def _from_arrays(cls, time, **kwargs):
+        """Create an event list from arrays that are already in final form.
+
+        Used internally by readers. ``time`` must already be a
+        ``numpy.ndarray`` of seconds from ``mjdref``, and all other array
+        attributes must be arrays of the same length: they are assigned by
+        reference, skipping the conversions and checks done in ``__init__``.
+
+        Parameters
+        ----------
+        time : numpy.ndarray
+            Event arrival times, in seconds from ``mjdref``
+
+        Other Parameters
+        ----------------
+        kwargs : dict
+            Any other attribute of the event list (``energy``, ``pi``,
+            ``mjdref``, ``gti``, etc.)
+
+        Returns
+        -------
+        ev : :class:`EventList` object
+        """
+        ev = cls()
+        ev.time = time
+        ev.ncounts = time.size
+        for key, val in kwargs.items():
+            setattr(ev, key, val)
+        return ev
+
     @classmethod
     def read(cls, filename, fmt=None, format_=None, **kwargs):
         r"""Read a :class:`EventList` object from file.
@@ -546,18 +881,18 @@ class EventList(StingrayTimeseries):
         if fmt.lower() in ('hea', 'ogip'):
             evtdata = load_events_and_gtis(filename, **kwargs)
 
-            evt = EventList(time=evtdata.ev_list,
-                            gti=evtdata.gti_list,
-                            pi=evtdata.pi_list,
-                            energy=evtdata.energy_list,
-                            mjdref=evtdata.mjdref,
-                            instr=evtdata.instr,
-                            mission=evtdata.mission,
-                            header=evtdata.header,
-                            detector_id=evtdata.detector_id,
-                            ephem=evtdata.ephem,
-                            timeref=evtdata.timeref,
-                            timesys=evtdata.timesys)
+            evt = cls._from_arrays(time=evtdata.ev_list,
+                                   gti=evtdata.gti_list,
+                                   pi=evtdata.pi_list,
+                                   energy=evtdata.energy_list,
+                                   mjdref=evtdata.mjdref,
+                                   instr=evtdata.instr,
+                                   mission=evtdata.mission,
+                                   header=evtdata.header,
+                                   detector_id=evtdata.detector_id,
+                                   ephem=evtdata.ephem,
+                                   timeref=evtdata.timeref,
+                                   timesys=evtdata.timesys)
             if 'additional_columns' in kwargs:
                 for key in evtdata.additional_data:
                     if not hasattr(evt, key.lower()):
@@ -566,7 +901,8 @@ class EventList(StingrayTimeseries):
 
         return super().read(filename=filename, fmt=fmt)
 
-    def filter_energy_range(self, energy_range, inplace=False, use_pi=False):
+    def filter_energy_range(self, energy_range, inplace=False, use_pi=False,
+                            assume_sorted=False):
         """Filter the event list from a given energy range.
 
         Parameters
@@ -581,6 +917,11 @@ class EventList(StingrayTimeseries):
             to a new event list.
         use_pi : bool, default False
             Use PI channel instead of energy in keV
+        assume_sorted : bool, default False
+            The energies (or PI channels, if ``use_pi`` is True) are known to
+            be sorted in increasing order. The selected events are then found
+            by bisection, and extracted with a slice instead of a mask. The
+            result is undefined if the values are not actually sorted.
 
         Examples
         --------
@@ -595,13 +936,27 @@ class EventList(StingrayTimeseries):
         True
         >>> np.allclose(events.time, [0, 1])
         True
+        >>> e3 = events.filter_energy_range([0.4, 1], assume_sorted=True)
+        >>> np.allclose(e3.time, [1])
+        True
 
         """
         if use_pi:
             energies = self.pi
         else:
             energies = self.energy
-        mask = (energies >= energy_range[0]) & (energies < energy_range[1])
+        energies = np.asarray(energies)
+        e_min, e_max = _bounds_in_dtype(energy_range, energies.dtype)
+
+        if assume_sorted:
+            # The selected events are a contiguous interval, and its borders
+            # are found by bisection
+            idx_start, idx_stop = np.searchsorted(
+                energies, np.asarray([e_min, e_max]), side='left')
+            mask = slice(idx_start, idx_stop)
+        else:
+            mask = energies >= e_min
+            np.logical_and(mask, energies < e_max, out=mask)
 
         return self.apply_mask(mask, inplace=inplace)
 
@@ -610,8 +965,9 @@ class EventList(StingrayTimeseries):
 
         Parameters
         ----------
-        mask : array of ``bool``
-            The mask. Has to be of the same length as ``self.time``
+        mask : array of ``bool``, array of ``int``, or ``slice``
+            The mask. If boolean, it has to be of the same length as
+            ``self.time``
 
         Other parameters
         ----------------
@@ -637,6 +993,19 @@ class EventList(StingrayTimeseries):
         """
         array_attrs = self.array_attrs()
 
+        # Convert a boolean mask to indices only once, instead of scanning
+        # the full mask again for every array attribute
+        is_slice = isinstance(mask, slice)
+        if not is_slice:
+            mask = np.asarray(mask)
+        if not is_slice and mask.dtype == bool:
+            if mask.size != np.size(self.time):
+                raise IndexError(
+                    "boolean index did not match the event list: "
+                    f"{np.size(self.time)} events but the mask has "
+                    f"{mask.size} elements")
+            mask = np.flatnonzero(mask)
+
         if inplace:
             new_ev = self
         else:
@@ -646,7 +1015,11 @@ class EventList(StingrayTimeseries):
 
         for attr in array_attrs:
             if hasattr(self, attr) and getattr(self, attr) is not None:
-                setattr(new_ev, attr, copy.deepcopy(np.asarray(getattr(self, attr))[mask]))
+                # Fancy indexing already returns a copy, slicing a view
+                new_attr = np.asarray(getattr(self, attr))[mask]
+                if is_slice:
+                    new_attr = new_attr.copy()
+                setattr(new_ev, attr, new_attr)
         return new_ev
 
     def apply_deadtime(self, deadtime, inplace=False, **kwargs):
@@ -699,7 +1072,10 @@ class EventList(StingrayTimeseries):
         """
         local_retall = kwargs.pop('return_all', False)
 
-        mask, retall = get_deadtime_mask(self.time, deadtime,
+        # The numba kernels in get_deadtime_mask are fastest on contiguous
+        # data. This is a no-op if the times are already contiguous.
+        time = np.ascontiguousarray(self.time)
+        mask, retall = get_deadtime_mask(time, deadtime,
                                          return_all=True,
                                          **kwargs)
 
@@ -1328,29 +1328,23 @@ def gti_border_bins(gtis, time, dt=None, epsilon=0.001):
     if time[-1] < np.min(gtis) or time[0] > np.max(gtis):
         raise ValueError("Invalid time interval for the given GTIs")
 
-    spectrum_start_bins = []
-    spectrum_stop_bins = []
-
     gti_low = gtis[:, 0] + dt / 2 - epsilon_times_dt
     gti_up = gtis[:, 1] - dt / 2 + epsilon_times_dt
 
-    for g0, g1 in zip(gti_low, gti_up):
-        startbin, stopbin = np.searchsorted(time, [g0, g1], "left")
-        stopbin += 1
-        if stopbin > time.size:
-            stopbin = time.size
-
-        if time[startbin] < g0:
-            startbin += 1
-        # Would be g[1] - dt/2, but stopbin is the end of an interval
-        # so one has to add one bin
-        if time[stopbin - 1] > g1:
-            stopbin -= 1
+    # Look for all GTI borders at once, instead of looping over the GTIs
+    spectrum_start_bins = np.searchsorted(time, gti_low, "left")
+    spectrum_stop_bins = np.searchsorted(time, gti_up, "left") + 1
+    spectrum_stop_bins = np.minimum(spectrum_stop_bins, time.size)
 
-        spectrum_start_bins.append(startbin)
-        spectrum_stop_bins.append(stopbin)
+    start_check = np.minimum(spectrum_start_bins, time.size - 1)
+    spectrum_start_bins[time[start_check] < gti_low] += 1
+    # GTIs starting after the last time stamp must not point beyond the array
+    spectrum_start_bins = np.minimum(spectrum_start_bins, time.size)
+    # Would be g[1] - dt/2, but stopbin is the end of an interval
+    # so one has to add one bin
+    spectrum_stop_bins[time[spectrum_stop_bins - 1] > gti_up] -= 1
 
-    return np.array(spectrum_start_bins), np.array(spectrum_stop_bins)
+    return spectrum_start_bins, spectrum_stop_bins
 
 
 def generate_indices_of_boundaries(times, gti, segment_size=None, dt=0):
@@ -161,7 +161,7 @@ def simulate_times_from_count_array(time, counts, gti, dt, use_spline=False):
 
 def simulate_with_inverse_cdf(
         binned_pdf, N, x_range=None, interp_kind="linear", sorted=False,
-        edges=None):
+        edges=None, rng=None):
     """Simulate single values from a binned probability distribution.
 
     Parameters
@@ -184,6 +184,10 @@ def simulate_with_inverse_cdf(
         Any valid interpolation kind accepted from `sci.interp1d`.
     sorted : bool, default False
         If true, sort the values.
+    rng : `np.random.Generator` or `np.random.RandomState`, default None
+        The random number generator to use. By default, the global
+        `np.random` state is used. A generator created with
+        `np.random.default_rng` is usually faster.
 
     Raises
     ------
@@ -226,6 +230,12 @@ def simulate_with_inverse_cdf(
     >>> np.all((vals >= 0)&(vals < 1))
     True
 
+    Any random number generator can be used
+    >>> vals = simulate_with_inverse_cdf([2, 0, 4, 3], 103,
+    ...                                  rng=np.random.default_rng(1234))
+    >>> np.count_nonzero((vals > 0.25)&(vals < 0.5)) == 0
+    True
+
     Do not pass negative values in the binned PDF!
     >>> simulate_with_inverse_cdf([2, -1., 4], 10)
     Traceback (most recent call last):
@@ -246,6 +256,8 @@ def simulate_with_inverse_cdf(
     """
     binned_pdf = np.asarray(binned_pdf).astype(float)
 
+    uniform = np.random.uniform if rng is None else rng.uniform
+
     if x_range is None:
         x_range = [0, 1]
 
@@ -258,7 +270,7 @@ def simulate_with_inverse_cdf(
             "curves")
 
     if len(binned_pdf) == 1:  # Corner case: a single bin
-        vals = np.random.uniform(x_range[0], x_range[1], N)
+        vals = uniform(x_range[0], x_range[1], N)
         if sorted:
             vals = np.sort(vals)
         return vals
@@ -267,13 +279,17 @@ def simulate_with_inverse_cdf(
     cdf = np.cumsum(binned_pdf)
     cdf /= cdf[-1]
 
+    cdf_vals = uniform(0, 1, N)
+    if sorted:
+        cdf_vals = np.sort(cdf_vals)
+
+    if interp_kind == "linear":
+        # Single vectorized binary search over the CDF, no interpolator object
+        return np.interp(cdf_vals, cdf, np.asarray(edges, dtype=float))
+
     inv_cdf_func = sci.interp1d(
         cdf,
         edges,
         kind=interp_kind)
 
-    cdf_vals = np.random.uniform(0, 1, N)
-    if sorted:
-        cdf_vals = np.sort(cdf_vals)
-
     return inv_cdf_func(cdf_vals)
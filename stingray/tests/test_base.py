@@ -103,6 +103,19 @@ class TestStingrayObject:
         _check_equal(so, new_so)
         assert not hasattr(new_so, "stingattr")
 
+    def test_astropy_table_shares_memory(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.guefus = np.random.randint(0, 4, 3)
+        ts = so.to_astropy_table()
+        assert np.shares_memory(ts["guefus"], so.guefus)
+
+    @pytest.mark.skipif("not _HAS_PANDAS")
+    def test_pandas_shares_memory(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.guefus = np.random.randint(0, 4, 3)
+        ts = so.to_pandas()
+        assert np.shares_memory(ts["guefus"].values, so.guefus)
+
     @pytest.mark.skipif("not _HAS_XARRAY")
     def test_xarray_roundtrip(self):
         so = copy.deepcopy(self.sting_obj)
@@ -216,6 +229,12 @@ class TestStingrayTimeseries:
         new_so = DummyStingrayTs.from_astropy_timeseries(ts)
         _check_equal(so, new_so)
 
+    def test_astropy_ts_shares_memory(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.guefus = np.random.randint(0, 4, 3)
+        ts = so.to_astropy_timeseries()
+        assert np.shares_memory(ts["guefus"], so.guefus)
+
     def test_shift_time(self):
         new_so = self.sting_obj.shift(1)
         assert np.allclose(new_so.time - 1, self.sting_obj.time)
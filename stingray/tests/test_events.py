@@ -80,6 +80,39 @@ class TestEvents(object):
         ev = EventList(times, high_precision=True)
         assert np.allclose(ev.time, times, atol=1e-15)
 
+    def test_create_float32_object(self):
+        times = np.sort(np.random.uniform(0, 1000, 101))
+        ev = EventList(times, gti=[[0, 1000]], time_dtype=np.float32)
+        assert ev.time.dtype == np.float32
+        assert ev.time.flags["C_CONTIGUOUS"]
+        assert np.allclose(ev.time, times, rtol=1e-6)
+
+        new_ev = ev.shift(10)
+        assert new_ev.time.dtype == np.float32
+        assert np.allclose(new_ev.time, times + 10, rtol=1e-6)
+
+    def test_high_precision_overrides_time_dtype(self):
+        ev = EventList([1, 2, 3], high_precision=True, time_dtype=np.float32)
+        assert ev.time.dtype == np.longdouble
+
+    @pytest.mark.skipif(
+        "np.finfo(np.longdouble).eps >= np.finfo(np.float64).eps",
+        reason="longdouble is not more precise than float64 here")
+    def test_change_mjdref_high_precision(self):
+        times = np.sort(
+            np.random.uniform(0, 1000, 101).astype(np.longdouble))
+        # This MJDREF difference cannot be represented in float64
+        mjdref = np.longdouble(57000) + np.longdouble(1e-13)
+        ev = EventList(times, mjdref=mjdref, high_precision=True)
+        new_ev = ev.change_mjdref(np.longdouble(57000))
+
+        expected_shift = (mjdref - np.longdouble(57000)) * np.longdouble(86400)
+        assert expected_shift > 0
+        assert new_ev.time.dtype == np.longdouble
+        assert new_ev.mjdref == 57000
+        assert np.allclose(new_ev.time - times, expected_shift,
+                           atol=1e-15, rtol=0)
+
     def test_inequal_length(self):
         """Check that exception is raised in case of
         disparity in length of 'time' and 'energy'
@@ -101,6 +134,76 @@ class TestEvents(object):
 
         assert (ev.time == np.array([0.5, 0.5, 1.5, 2.5, 2.5])).all()
 
+    def test_from_lc_with_negative_counts(self):
+        lc = Lightcurve(time=[0.5, 1.5, 2.5], counts=[2, -1, 3], dt=1,
+                        skip_checks=True)
+        ev = EventList.from_lc(lc)
+
+        assert (ev.time == np.array([0.5, 0.5, 2.5, 2.5, 2.5])).all()
+
+    def test_array_attrs_follow_changes(self):
+        ev = EventList(time=[0, 1, 2], pi=[3, 4, 5])
+        assert ev.array_attrs() == ["pi", "time"]
+        ev.energy = np.array([1, 2, 3])
+        assert ev.array_attrs() == ["energy", "pi", "time"]
+        ev.time = np.array([0, 1])
+        assert ev.array_attrs() == ["time"]
+        ev.pi = np.array([3, 4])
+        del ev.energy
+        assert ev.array_attrs() == ["pi", "time"]
+
+    def test_array_attrs_after_in_place_change(self):
+        ev = EventList(time=[0, 1, 2], pi=[3, 4, 5])
+        ev.bubu = [1, 2]
+        assert ev.array_attrs() == ["pi", "time"]
+        ev.bubu.append(3)
+        assert ev.array_attrs() == ["bubu", "pi", "time"]
+        new_ev = ev.apply_mask([True, False, True])
+        assert np.allclose(new_ev.bubu, [1, 3])
+
+    def test_apply_mask_slice(self):
+        ev = EventList(time=[0, 1, 2, 3], pi=[1, 2, 3, 4])
+        new_ev = ev.apply_mask(slice(1, 3))
+        assert np.allclose(new_ev.time, [1, 2])
+        assert np.allclose(new_ev.pi, [2, 3])
+        assert not np.shares_memory(new_ev.time, ev.time)
+
+    def test_apply_mask_wrong_length(self):
+        ev = EventList(time=[0, 1, 2], pi=[1, 2, 3])
+        with pytest.raises(IndexError):
+            ev.apply_mask([True, False])
+
+    def test_counts_per_detector(self):
+        ev = EventList(time=[0, 1, 2, 3, 4], detector_id=[1, 3, 1, 1, 3])
+        assert np.allclose(ev.counts_per_detector(), [0, 3, 0, 2])
+        assert np.allclose(ev.counts_per_detector(n_det=5), [0, 3, 0, 2, 0])
+
+    def test_mean_time_per_detector(self):
+        ev = EventList(time=[0, 1, 2, 3, 4], detector_id=[1, 3, 1, 1, 3])
+        mean_time = ev.mean_time_per_detector()
+        assert np.allclose(mean_time[[1, 3]], [5 / 3, 2.5])
+        assert np.all(np.isnan(mean_time[[0, 2]]))
+
+    @pytest.mark.skipif(
+        "np.finfo(np.longdouble).eps >= np.finfo(np.float64).eps",
+        reason="longdouble is not more precise than float64 here")
+    def test_mean_time_per_detector_high_precision(self):
+        offsets = np.array([1, 2, 3, 5], dtype=np.longdouble) * 1e-8
+        times = np.longdouble(1e9) + offsets
+        ev = EventList(time=times, detector_id=[0, 1, 0, 1],
+                       high_precision=True)
+        mean_time = ev.mean_time_per_detector()
+        assert mean_time.dtype == np.longdouble
+        assert np.allclose(mean_time - np.longdouble(1e9),
+                           [2e-8, 3.5e-8], atol=1e-9, rtol=0)
+
+    def test_per_detector_without_detector_id(self):
+        ev = EventList(time=[0, 1, 2])
+        with pytest.raises(ValueError, match="no detector_id"):
+            ev.counts_per_detector()
+        with pytest.raises(ValueError, match="no detector_id"):
+            ev.mean_time_per_detector()
+
     def test_simulate_times_warns_bin_time(self):
         """Simulate photon arrival times for an event list
         from light curve.
@@ -131,6 +234,14 @@ class TestEvents(object):
         ev = EventList(ncounts=100)
         ev.simulate_energies(self.spectrum)
 
+    def test_simulate_energies_with_rng(self):
+        ev0 = EventList(ncounts=100)
+        ev0.simulate_energies(self.spectrum, rng=np.random.default_rng(42))
+        ev1 = EventList(ncounts=100)
+        ev1.simulate_energies(self.spectrum, rng=np.random.default_rng(42))
+        assert np.allclose(ev0.energy, ev1.energy)
+        assert np.all((ev0.energy >= 0.5) & (ev0.energy <= 6.5))
+
     def test_simulate_energies_with_1d_spectrum(self):
         """Test that simulate_energies() method raises index
         error exception is spectrum is 1-d.
@@ -170,6 +281,33 @@ class TestEvents(object):
         assert np.all(np.abs(lc_prob - fluxes_prob) < 3 * np.sqrt(fluxes_prob))
         assert np.all((ev.energy >= 0.5)&(ev.energy < 6.5))
 
+    @pytest.mark.parametrize("sort_energy", [True, False])
+    def test_filter_energy_range(self, sort_energy):
+        energy = np.array([3.5, 0.2, 1.0, 7.1, 2.0, 3.0, 0.5])
+        if sort_energy:
+            energy = np.sort(energy)
+        ev = EventList(time=np.arange(energy.size), energy=energy,
+                       pi=np.arange(energy.size))
+        ev_filt = ev.filter_energy_range([0.5, 3.0],
+                                         assume_sorted=sort_energy)
+        good = (energy >= 0.5) & (energy < 3.0)
+        assert np.allclose(ev_filt.energy, energy[good])
+        assert np.allclose(ev_filt.time, ev.time[good])
+        assert np.allclose(ev_filt.pi, ev.pi[good])
+
+    @pytest.mark.parametrize("sort_pi", [True, False])
+    @pytest.mark.parametrize("pi_range", [[0.5, 10.5], [1, 10], [-1e6, 5.2]])
+    def test_filter_integer_pi_range(self, sort_pi, pi_range):
+        pi = np.array([10, 0, 1, 11, 5, 2, 32767], dtype=np.int16)
+        if sort_pi:
+            pi = np.sort(pi)
+        ev = EventList(time=np.arange(pi.size), pi=pi)
+        ev_filt = ev.filter_energy_range(pi_range, use_pi=True,
+                                         assume_sorted=sort_pi)
+        good = (pi >= pi_range[0]) & (pi < pi_range[1])
+        assert np.all(ev_filt.pi == pi[good])
+        assert np.allclose(ev_filt.time, ev.time[good])
+
     def test_join_without_times_simulated(self):
         """Test if exception is raised when join method is
         called before first simulating times.
@@ -215,6 +353,23 @@ class TestEvents(object):
             ev_new = ev.join(ev_other)
         assert np.allclose(ev_new.time, [1, 2, 3])
 
+    def test_join_empty_list_with_attributes(self):
+        ev = EventList([])
+        ev_other = EventList(time=[1, 2, 3], pi=[4, 5, 6], energy=[1, 2, 3])
+        with warnings.catch_warnings(record=True):
+            ev_new = ev.join(ev_other)
+        assert np.allclose(ev_new.time, [1, 2, 3])
+        assert np.allclose(ev_new.pi, [4, 5, 6])
+        assert np.allclose(ev_new.energy, [1, 2, 3])
+        assert ev_new.time is not ev_other.time
+
+        # Unsorted input is still sorted
+        ev_other = EventList(time=[3, 1, 2], pi=[6, 4, 5])
+        with warnings.catch_warnings(record=True):
+            ev_new = ev_other.join(EventList([]))
+        assert np.allclose(ev_new.time, [1, 2, 3])
+        assert np.allclose(ev_new.pi, [4, 5, 6])
+
     def test_join_different_dt(self):
         ev = EventList(time=[10, 20, 30], dt=1)
         ev_other = EventList(time=[40, 50, 60], dt=3)
@@ -244,6 +399,14 @@ class TestEvents(object):
 
         assert np.allclose(ev_new.pi, [3, 3, 3, 0, 0])
 
+    def test_join_sorted_interleaved(self):
+        ev = EventList(time=[1, 2, 2, 5], pi=[1, 2, 3, 4])
+        ev_other = EventList(time=[0, 2, 6], pi=[5, 6, 7])
+        ev_new = ev.join(ev_other)
+
+        assert np.allclose(ev_new.time, [0, 1, 2, 2, 2, 5, 6])
+        assert np.allclose(ev_new.pi, [5, 1, 2, 3, 6, 4, 7])
+
     def test_join_with_gti_none(self):
         ev = EventList(time=[1, 2, 3])
         ev_other = EventList(time=[4, 5], gti=[[3.5, 5.5]])
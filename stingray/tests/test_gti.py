@@ -277,6 +277,14 @@ class TestGTI(object):
         assert start_bins == [0]
         assert stop_bins == [len(times)]
 
+    def test_gti_border_bins_gti_after_last_time(self):
+        times = np.arange(0.5, 25)
+
+        start_bins, stop_bins = gti_border_bins([[0, 10], [30, 40]], times)
+        assert np.allclose(start_bins, [0, 25])
+        assert np.allclose(stop_bins, [10, 25])
+        assert times[start_bins[1]:stop_bins[1]].size == 0
+
     def test_decide_spectrum_lc_intervals_invalid(self):
         with pytest.raises(ValueError):
             a, b = bin_intervals_from_gtis([[0, 400]], 128, [500, 501])